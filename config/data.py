@@ -1,106 +1,300 @@
+import functools
 import json
 import os
+import pickle
+import pwd
+import socket
 
 import gi
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 gi.require_version("Gtk", "3.0")
-from fabric.utils.helpers import get_relative_path
-from gi.repository import Gdk, GLib
+from gi.repository import GLib
 
 APP_NAME_CAP = "Rz-Shell"
 APP_NAME = APP_NAME_CAP.lower()
 
-CACHE_DIR = str(GLib.get_user_cache_dir()) + f"/{APP_NAME}"
+# settings_constants imports APP_NAME/APP_NAME_CAP back from this module, so
+# this is as early as the defaults can be imported
+from .settings_constants import DEFAULTS
+
+CACHE_DIR = os.path.join(GLib.get_user_cache_dir(), APP_NAME)
 
-USERNAME = os.getlogin()
-HOSTNAME = os.uname().nodename
 HOME_DIR = os.path.expanduser("~")
 
 CONFIG_DIR = os.path.expanduser(f"~/.config/{APP_NAME}")
 
-screen = Gdk.Screen.get_default()
-CURRENT_WIDTH = screen.get_width()
-CURRENT_HEIGHT = screen.get_height()
-
-CONFIG_FILE = get_relative_path("../config/config.json")
+CONFIG_FILE = os.path.join(HOME_DIR, ".config", APP_NAME_CAP, "config", "config.json")
 MATUGEN_STATE_FILE = os.path.join(CONFIG_DIR, "matugen")
+CONFIG_CACHE_FILE = os.path.join(CACHE_DIR, "config.pkl")
+GENERATED_FILE = os.path.join(os.path.dirname(__file__), "_generated.py")
+
+
+def _read_bytes(path):
+    """Read a whole file with a single read() call"""
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def _load_json(path):
+    """Parse a JSON file, using orjson when it is available"""
+    raw = _read_bytes(path)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_json_cached(path, st):
+    """Parse a JSON file, reusing a pickled copy while the file is unchanged"""
+    key = (path, st.st_mtime_ns, st.st_size)
+
+    try:
+        with open(CONFIG_CACHE_FILE, "rb") as f:
+            cached_key, cached = pickle.load(f)
+        if cached_key == key:
+            return cached
+    except Exception:
+        pass
+
+    parsed = _load_json(path)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{CONFIG_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, parsed), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, CONFIG_CACHE_FILE)
+    except OSError as e:
+        print(f"Error writing config cache: {e}")
+
+    return parsed
+
+
+_config_cache = None
+_config_mtime = None
 
 
 def load_config():
-    """Load the configuration from config.json"""
-    config_path = os.path.expanduser(f"~/.config/{APP_NAME_CAP}/config/config.json")
-    config = {}
+    """Return the configuration from config.json, re-parsing it only when it changes"""
+    global _config_cache, _config_mtime
 
-    if os.path.exists(config_path):
+    try:
+        st = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        st = None
+
+    mtime = st.st_mtime_ns if st is not None else None
+    if _config_cache is not None and mtime == _config_mtime:
+        return _config_cache
+
+    config = {}
+    if st is not None:
         try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
-        except Exception as e:
-            print(f"Error loading config: {e}")
+            config = _load_json_cached(CONFIG_FILE, st)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Error loading config file: {e}")
 
+    _config_cache = config
+    _config_mtime = mtime
     return config
 
 
-# Import defaults from settings_constants to avoid duplication
-from .settings_constants import DEFAULTS
+def get_default(setting_str: str):
+    return DEFAULTS.get(setting_str, "")
 
-# Load configuration once and use throughout the module
-config = {}
-if os.path.exists(CONFIG_FILE):
-    try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-    except Exception as e:
-        print(f"Error loading config file: {e}")
+
+# Module attribute -> settings key, resolved on first access
+_SETTING_ATTRS = {
+    "WALLPAPERS_DIR": "wallpapers_dir",
+    "BAR_POSITION": "bar_position",
+    "CENTERED_BAR": "centered_bar",
+    "DATETIME_12H_FORMAT": "datetime_12h_format",
+    "TERMINAL_COMMAND": "terminal_command",
+    "DOCK_ENABLED": "dock_enabled",
+    "DOCK_ALWAYS_SHOW": "dock_always_show",
+    "DOCK_ICON_SIZE": "dock_icon_size",
+    "BAR_WORKSPACE_SHOW_NUMBER": "bar_workspace_show_number",
+    "BAR_WORKSPACE_USE_CHINESE_NUMERALS": "bar_workspace_use_chinese_numerals",
+    "BAR_HIDE_SPECIAL_WORKSPACE": "bar_hide_special_workspace",
+    "BAR_THEME": "bar_theme",
+    "DOCK_THEME": "dock_theme",
+    "PANEL_THEME": "panel_theme",
+    "PANEL_POSITION": "panel_position",
+    "NOTIF_POS": "notif_pos",
+    "BAR_METRICS_DISKS": "bar_metrics_disks",
+    "METRICS_VISIBLE": "metrics_visible",
+    "METRICS_SMALL_VISIBLE": "metrics_small_visible",
+    "SELECTED_MONITORS": "selected_monitors",
+}
 
 
-def get_default(setting_str: str):
-    return DEFAULTS[setting_str] if setting_str in DEFAULTS else ""
-
-
-def _get_config_var(setting_str: str):
-    return config.get(setting_str, get_default(setting_str))
-
-
-# Set configuration values using defaults from settings_constants
-WALLPAPERS_DIR = _get_config_var("wallpapers_dir")
-BAR_POSITION = _get_config_var("bar_position")
-VERTICAL = BAR_POSITION in ["Left", "Right"]
-CENTERED_BAR = _get_config_var("centered_bar")
-DATETIME_12H_FORMAT = _get_config_var("datetime_12h_format")
-TERMINAL_COMMAND = _get_config_var("terminal_command")
-DOCK_ENABLED = _get_config_var("dock_enabled")
-DOCK_ALWAYS_SHOW = _get_config_var("dock_always_show")
-DOCK_ICON_SIZE = _get_config_var("dock_icon_size")
-BAR_WORKSPACE_SHOW_NUMBER = _get_config_var("bar_workspace_show_number")
-BAR_WORKSPACE_USE_CHINESE_NUMERALS = _get_config_var(
-    "bar_workspace_use_chinese_numerals"
+@functools.lru_cache(maxsize=1)
+def get_screen_size():
+    """Return the default screen's (width, height), querying the display once"""
+    from gi.repository import Gdk
+
+    screen = Gdk.Screen.get_default()
+    return screen.get_width(), screen.get_height()
+
+
+# Bar components whose visibility is controlled by "bar_<name>_visible"
+_VIS_KEYS = (
+    "button_apps",
+    "systray",
+    "control",
+    "network",
+    "button_tools",
+    "sysprofiles",
+    "button_overview",
+    "ws_container",
+    "weather",
+    "battery",
+    "metrics",
+    "language",
+    "date_time",
+    "button_power",
 )
-BAR_HIDE_SPECIAL_WORKSPACE = _get_config_var("bar_hide_special_workspace")
-BAR_THEME = _get_config_var("bar_theme")
-DOCK_THEME = _get_config_var("dock_theme")
-PANEL_THEME = _get_config_var("panel_theme")
-PANEL_POSITION = _get_config_var("panel_position")
-NOTIF_POS = _get_config_var("notif_pos")
-
-BAR_COMPONENTS_VISIBILITY = {
-    "button_apps": _get_config_var("bar_button_apps_visible"),
-    "systray": _get_config_var("bar_systray_visible"),
-    "control": _get_config_var("bar_control_visible"),
-    "network": _get_config_var("bar_network_visible"),
-    "button_tools": _get_config_var("bar_button_tools_visible"),
-    "sysprofiles": _get_config_var("bar_sysprofiles_visible"),
-    "button_overview": _get_config_var("bar_button_overview_visible"),
-    "ws_container": _get_config_var("bar_ws_container_visible"),
-    "weather": _get_config_var("bar_weather_visible"),
-    "battery": _get_config_var("bar_battery_visible"),
-    "metrics": _get_config_var("bar_metrics_visible"),
-    "language": _get_config_var("bar_language_visible"),
-    "date_time": _get_config_var("bar_date_time_visible"),
-    "button_power": _get_config_var("bar_button_power_visible"),
+_VIS_SETTINGS = tuple(f"bar_{name}_visible" for name in _VIS_KEYS)
+
+
+def _load_screen():
+    width, height = get_screen_size()
+    return {"CURRENT_WIDTH": width, "CURRENT_HEIGHT": height}
+
+
+def _load_user():
+    return {
+        "USERNAME": os.environ.get("USER") or pwd.getpwuid(os.geteuid()).pw_name,
+        "HOSTNAME": socket.gethostname(),
+    }
+
+
+def _mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _generated_key():
+    """Inputs the generated module depends on: config.json, the defaults and
+    this module, which defines which settings it holds"""
+    from . import settings_constants
+
+    return (
+        _mtime_ns(CONFIG_FILE),
+        _mtime_ns(settings_constants.__file__),
+        _mtime_ns(__file__),
+    )
+
+
+def _resolve_settings(config):
+    # Resolve every setting against its default in a single pass, with the
+    # bound lookup hoisted out of the loop
+    config_get = config.get
+    _R = {key: config_get(key, default) for key, default in DEFAULTS.items()}
+
+    values = {attr: _R[key] for attr, key in _SETTING_ATTRS.items()}
+    values["config"] = config
+    values["VERTICAL"] = values["BAR_POSITION"] in ["Left", "Right"]
+    values["BAR_COMPONENTS_VISIBILITY"] = {
+        name: _R[key] for name, key in zip(_VIS_KEYS, _VIS_SETTINGS)
+    }
+    return values
+
+
+def _load_generated():
+    """Return the settings precomputed in _generated.py, if they are current"""
+    global _config_cache, _config_mtime
+
+    try:
+        from . import _generated
+    except ImportError:
+        return None
+
+    config_mtime, defaults_mtime, schema_mtime = _generated_key()
+    try:
+        if (
+            _generated._CONFIG_MTIME,
+            _generated._DEFAULTS_MTIME,
+            _generated._SCHEMA_MTIME,
+        ) != (config_mtime, defaults_mtime, schema_mtime):
+            return None
+        values = {name: getattr(_generated, name) for name in _SETTINGS_NAMES}
+    except AttributeError:
+        # Written by an older version of this module
+        return None
+
+    # Seed load_config() so it doesn't re-parse the file either
+    _config_cache = values["config"]
+    _config_mtime = config_mtime
+    return values
+
+
+def _load_settings():
+    return _load_generated() or _resolve_settings(load_config())
+
+
+def write_generated_config():
+    """Write _generated.py with the settings resolved from the current config"""
+    config_mtime, defaults_mtime, schema_mtime = _generated_key()
+    values = _resolve_settings(load_config())
+
+    lines = [
+        f"# Generated by {APP_NAME_CAP} from config.json, do not edit.",
+        "",
+        f"_CONFIG_MTIME = {config_mtime!r}",
+        f"_DEFAULTS_MTIME = {defaults_mtime!r}",
+        f"_SCHEMA_MTIME = {schema_mtime!r}",
+        "",
+    ]
+    lines += [f"{name} = {values[name]!r}" for name in _SETTINGS_NAMES]
+
+    tmp_path = f"{GENERATED_FILE}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, GENERATED_FILE)
+
+
+_SETTINGS_NAMES = ("config", "VERTICAL", "BAR_COMPONENTS_VISIBILITY", *_SETTING_ATTRS)
+
+_LAZY_LOADERS = {
+    "CURRENT_WIDTH": _load_screen,
+    "CURRENT_HEIGHT": _load_screen,
+    "USERNAME": _load_user,
+    "HOSTNAME": _load_user,
+    **dict.fromkeys(_SETTINGS_NAMES, _load_settings),
 }
 
-BAR_METRICS_DISKS = _get_config_var("bar_metrics_disks")
-METRICS_VISIBLE = _get_config_var("metrics_visible")
-METRICS_SMALL_VISIBLE = _get_config_var("metrics_small_visible")
-SELECTED_MONITORS = _get_config_var("selected_monitors")
\ No newline at end of file
+__all__ = [
+    "APP_NAME",
+    "APP_NAME_CAP",
+    "CACHE_DIR",
+    "HOME_DIR",
+    "CONFIG_DIR",
+    "CONFIG_FILE",
+    "MATUGEN_STATE_FILE",
+    "load_config",
+    "get_default",
+    "get_screen_size",
+    "write_generated_config",
+    *_LAZY_LOADERS,
+]
+
+
+def __getattr__(name):
+    """Compute expensive module attributes on first access (PEP 562)"""
+    loader = _LAZY_LOADERS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals().update(loader())
+    return globals()[name]
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from fabric.utils.helpers import get_relative_path
 
 from .data import (
@@ -10,7 +12,7 @@ SOURCE_STRING = f"""
 source = ~/.config/{APP_NAME_CAP}/config/hypr/{APP_NAME}.conf
 """
 
-DEFAULTS = {
+_DEFAULTS = {
     "prefix_restart": "SUPER ALT",
     "suffix_restart": "B",
     "prefix_rzmsg": "SUPER",
@@ -123,3 +125,6 @@ DEFAULTS = {
         "ticking_sound": False,
     },
 }
+
+# Read-only view so callers can't mutate the shared defaults
+DEFAULTS = MappingProxyType(_DEFAULTS)
@@ -23,6 +23,7 @@ from PIL import Image
 from .data import (
     APP_NAME,
     APP_NAME_CAP,
+    write_generated_config,
 )
 from .settings_utils import (
     backup_and_replace,
@@ -1618,6 +1619,12 @@ class HyprConfGUI(Window):
             except Exception as e:
                 print(f"Error saving config.json: {e}")
 
+            try:
+                write_generated_config()
+                print(f"{time.time():.4f}: Regenerated config module.")
+            except Exception as e:
+                print(f"Error regenerating config module: {e}")
+
             if selected_icon_path:
                 print(f"{time.time():.4f}: Processing face icon...")
                 try:
@@ -8,7 +8,11 @@ Maintains full design consistency with existing UI components and follows the sa
 patterns used in the dashboard and other modules.
 """
 
-import math
+import logging
+import re
+import weakref
+from enum import IntEnum
+from math import ceil
 
 import gi
 from fabric.audio.service import Audio
@@ -26,23 +30,175 @@ from gi.repository import Gtk
 import config.data as data
 import modules.icons as icons
 
-vertical_mode = (
-    True
-    if data.PANEL_THEME == "Panel"
-    and (
-        data.BAR_POSITION in ["Left", "Right"]
-        or data.PANEL_POSITION in ["Start", "End"]
-    )
-    else False
+logger = logging.getLogger(__name__)
+
+_ACTIVE_GLYPH = "●"  # Filled circle
+_INACTIVE_GLYPH = "○"  # Empty circle
+
+_VERTICAL_BAR_POSITIONS = frozenset({"Left", "Right"})
+_VERTICAL_PANEL_POSITIONS = frozenset({"Start", "End"})
+
+vertical_mode = data.PANEL_THEME == "Panel" and (
+    data.BAR_POSITION in _VERTICAL_BAR_POSITIONS
+    or data.PANEL_POSITION in _VERTICAL_PANEL_POSITIONS
+)
+
+# Input devices hidden from the mixer: monitors, peak detect, cava, etc.
+_UNWANTED_RE = re.compile(
+    r"monitor|peak detect|cava|echo cancel|rnnoise|webrtc|virtual"
 )
 
 
+class StreamKind(IntEnum):
+    APP = 0
+    MIC = 1
+    SPEAKER = 2
+
+
+# Classification per stream object, dropped when the stream goes away
+_stream_kinds = weakref.WeakKeyDictionary()
+
+
+def _stream_kind(stream):
+    """Classify a stream from its type string, parsing it only once per stream."""
+    try:
+        return _stream_kinds[stream]
+    except (KeyError, TypeError):
+        pass
+
+    stream_type = getattr(stream, "type", "").lower()
+    if "microphone" in stream_type or "input" in stream_type:
+        kind = StreamKind.MIC
+    elif "application" in stream_type:
+        kind = StreamKind.APP
+    else:
+        kind = StreamKind.SPEAKER
+
+    try:
+        _stream_kinds[stream] = kind
+    except TypeError:
+        pass
+    return kind
+
+
+def _disconnect_stream(stream, handler_id):
+    """Disconnect a stream handler, tolerating streams that already went away."""
+    try:
+        if stream.handler_is_connected(handler_id):
+            stream.disconnect(handler_id)
+    except Exception:
+        pass
+
+
+class StreamUpdateHub:
+    """
+    Shares a single "changed" connection per stream between the mixer widgets
+    and throttles it, so a burst of backend updates results in at most one
+    UI update per THROTTLE_MS.
+    """
+
+    THROTTLE_MS = 50
+    _hubs = {}
+
+    @classmethod
+    def for_stream(cls, stream):
+        hub = cls._hubs.get(id(stream))
+        if hub is None:
+            hub = cls._hubs[id(stream)] = cls(stream)
+        return hub
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._subscribers = []
+        self._source = 0
+        self._handler_id = stream.connect("changed", self._on_changed)
+
+    def subscribe(self, callback):
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+        if not self._subscribers:
+            self._close()
+
+    def _on_changed(self, *args):
+        if self._source == 0:
+            self._source = GLib.timeout_add(self.THROTTLE_MS, self._flush)
+
+    def _flush(self):
+        self._source = 0
+        for callback in list(self._subscribers):
+            callback(self.stream)
+        return GLib.SOURCE_REMOVE
+
+    def _close(self):
+        """Drop the stream connection once the last subscriber is gone."""
+        if self._source:
+            GLib.source_remove(self._source)
+            self._source = 0
+        _disconnect_stream(self.stream, self._handler_id)
+        if self._hubs.get(id(self.stream)) is self:
+            del self._hubs[id(self.stream)]
+
+
+def _sync_stream_widgets(content_box, widgets, streams, build, empty_widget=None):
+    """
+    Make content_box show one widget per stream, in order, reusing the widgets
+    cached in `widgets` (keyed by id(stream)) and only building new ones.
+    Shows `empty_widget`, if given, instead when there are no streams.
+    Returns the widgets that were newly added to content_box.
+    """
+    # Hold child-notify emissions until the whole batch has been applied
+    content_box.freeze_child_notify()
+    try:
+        new_streams = {id(stream): stream for stream in streams}
+        added = []
+
+        for stream_id in set(widgets) - set(new_streams):
+            widget = widgets.pop(stream_id)
+            content_box.remove(widget)
+            widget.destroy()
+
+        if not new_streams:
+            if empty_widget is not None and empty_widget.get_parent() is None:
+                content_box.add(empty_widget)
+                added.append(empty_widget)
+            return added
+
+        if empty_widget is not None and empty_widget.get_parent() is not None:
+            content_box.remove(empty_widget)
+
+        ordered = []
+        for stream_id, stream in new_streams.items():
+            widget = widgets.get(stream_id)
+            if widget is None:
+                widget = widgets[stream_id] = build(stream)
+                content_box.add(widget)
+                added.append(widget)
+            ordered.append(widget)
+
+        if content_box.get_children() != ordered:
+            for position, widget in enumerate(ordered):
+                content_box.reorder_child(widget, position)
+
+        return added
+    finally:
+        content_box.thaw_child_notify()
+
+
 class MuteToggleButton(Button):
     """A mute/unmute toggle button that follows existing button styling patterns."""
     
     def __init__(self, stream, **kwargs):
         self.stream = stream
         self._updating_from_stream = False
+
+        # Stream type never changes, so pick the icon pair once
+        if _stream_kind(stream) == StreamKind.MIC:
+            self._icon_on, self._icon_off = icons.mic, icons.mic_mute
+        else:
+            self._icon_on, self._icon_off = icons.vol_medium, icons.vol_mute
         
         # Create the button with initial mute state
         self.icon_label = Label(
@@ -54,25 +210,27 @@ class MuteToggleButton(Button):
             name="mute-toggle-button",
             child=self.icon_label,
             on_clicked=self._on_clicked,
-            tooltip_text=self._get_tooltip_text(),
             **kwargs
         )
         
-        # Connect to stream changes
-        stream.connect("changed", self._on_stream_changed)
+        # Connect to stream changes, dropping the handler with the widget
+        self._stream_hub = StreamUpdateHub.for_stream(stream)
+        self._stream_hub.subscribe(self._on_stream_changed)
+        self.connect("destroy", self._on_destroy)
+        self._last_muted = bool(stream.muted)
         self._update_appearance()
     
     def _get_mute_icon(self):
         """Get the appropriate mute icon based on stream type and state."""
-        if hasattr(self.stream, "type") and ("microphone" in self.stream.type.lower() or "input" in self.stream.type.lower()):
-            return icons.mic_mute if self.stream.muted else icons.mic
-        else:
-            return icons.vol_mute if self.stream.muted else icons.vol_medium
+        return self._icon_off if self.stream.muted else self._icon_on
     
     def _get_tooltip_text(self):
         """Get tooltip text based on current mute state."""
         return "Unmute" if self.stream.muted else "Mute"
     
+    def _on_destroy(self, *args):
+        self._stream_hub.unsubscribe(self._on_stream_changed)
+
     def _on_clicked(self, *args):
         """Toggle mute state when clicked."""
         if self._updating_from_stream:
@@ -82,6 +240,11 @@ class MuteToggleButton(Button):
     
     def _on_stream_changed(self, stream):
         """Update button when stream changes."""
+        # Volume changes also emit "changed"; only a mute flip affects the button
+        muted = bool(stream.muted)
+        if muted == self._last_muted:
+            return
+        self._last_muted = muted
         self._updating_from_stream = True
         self._update_appearance()
         self._updating_from_stream = False
@@ -105,11 +268,12 @@ class DeviceSelector(Button):
         self.device = device
         self.is_active = is_active
         self.on_select_callback = on_select
+        self._last_active = None
         
-        # Create the selection indicator
+        # Create the selection indicator, filled in by _update_appearance
         self.selection_icon = Label(
             name="device-selector-icon",
-            markup=icons.circle if is_active else icons.circle,
+            markup="",
         )
         
         super().__init__(
@@ -134,12 +298,15 @@ class DeviceSelector(Button):
     
     def _update_appearance(self):
         """Update appearance based on active state."""
+        if self.is_active == self._last_active:
+            return
+        self._last_active = self.is_active
         if self.is_active:
             self.add_style_class("active")
-            self.selection_icon.set_markup("●")  # Filled circle
+            self.selection_icon.set_markup(_ACTIVE_GLYPH)
         else:
             self.remove_style_class("active")
-            self.selection_icon.set_markup("○")  # Empty circle
+            self.selection_icon.set_markup(_INACTIVE_GLYPH)
 
 
 class MixerSlider(Scale):
@@ -157,37 +324,68 @@ class MixerSlider(Scale):
 
         self.stream = stream
         self._updating_from_stream = False
+        # Debounced volume write, so a drag doesn't hit the backend every tick
+        self._pending_source = 0
+        self._pending_value = None
         self.set_value(stream.volume / 100)
         self.set_size_request(-1, 30)  # Fixed height for sliders
 
         self.connect("value-changed", self.on_value_changed)
-        stream.connect("changed", self.on_stream_changed)
+        self.connect("destroy", self._on_destroy)
+        self._stream_hub = StreamUpdateHub.for_stream(stream)
+        self._stream_hub.subscribe(self.on_stream_changed)
 
-        # Apply appropriate style class based on stream type
-        if hasattr(stream, "type"):
-            if "microphone" in stream.type.lower() or "input" in stream.type.lower():
-                self.add_style_class("mic")
-            else:
-                self.add_style_class("vol")
-        else:
-            # Default to volume style
-            self.add_style_class("vol")
+        # Apply appropriate style class based on stream type, defaulting to volume
+        self.add_style_class("mic" if _stream_kind(stream) == StreamKind.MIC else "vol")
 
         # Set initial tooltip and muted state
-        self.set_tooltip_text(f"{stream.volume:.0f}%")
+        self._last_pct = -1
+        self._set_tooltip_pct(stream.volume)
         self.update_muted_state()
 
+    def _set_tooltip_pct(self, volume):
+        """Update the percentage tooltip only when the rounded value changes."""
+        pct = round(volume)
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.set_tooltip_text(f"{pct}%")
+
     def on_value_changed(self, _):
         if self._updating_from_stream:
             return
         if self.stream:
-            self.stream.volume = self.value * 100
-            self.set_tooltip_text(f"{self.value * 100:.0f}%")
+            self._pending_value = self.value
+            self._set_tooltip_pct(self.value * 100)
+            if self._pending_source == 0:
+                self._pending_source = GLib.timeout_add(80, self._flush_volume)
+
+    def _flush_volume(self):
+        """Write the last slider value to the stream once the drag settles."""
+        self._pending_source = 0
+        if self.stream and self._pending_value is not None:
+            self.stream.volume = self._pending_value * 100
+        return GLib.SOURCE_REMOVE
+
+    def _cancel_pending(self):
+        if self._pending_source:
+            GLib.source_remove(self._pending_source)
+            self._pending_source = 0
+
+    def _on_destroy(self, *args):
+        self._cancel_pending()
+        self._stream_hub.unsubscribe(self.on_stream_changed)
 
     def on_stream_changed(self, stream):
+        if self._pending_source:
+            # The stream already reached the value we were about to write
+            if round(stream.volume) == round(self._pending_value * 100):
+                self._cancel_pending()
+            else:
+                # A write is still pending, don't yank the slider back mid-drag
+                return
         self._updating_from_stream = True
         self.value = stream.volume / 100
-        self.set_tooltip_text(f"{stream.volume:.0f}%")
+        self._set_tooltip_pct(stream.volume)
         self.update_muted_state()
         self._updating_from_stream = False
 
@@ -222,13 +420,13 @@ class StreamControl(Box):
         )
         
         # Stream name and volume info
-        label_text = stream.description
-        if hasattr(stream, "type") and "application" in stream.type.lower():
-            label_text = getattr(stream, "name", stream.description)
+        self._is_app = _stream_kind(stream) == StreamKind.APP
+        label_text = self._label_text_for(stream)
+        self._last_label = (ceil(stream.volume), label_text)
         
         self.stream_label = Label(
             name="mixer-stream-label",
-            label=f"[{math.ceil(stream.volume)}%] {label_text}",
+            label=f"[{self._last_label[0]}%] {label_text}",
             h_expand=True,
             h_align="start",
             v_align="center",
@@ -268,19 +466,32 @@ class StreamControl(Box):
         self.slider = MixerSlider(stream)
         
         # Connect to stream changes to update label
-        stream.connect("changed", self._on_stream_changed)
+        self._stream_hub = StreamUpdateHub.for_stream(stream)
+        self._stream_hub.subscribe(self._on_stream_changed)
+        self.connect("destroy", self._on_destroy)
         
         # Add components
         self.add(self.top_row)
         self.add(self.slider)
     
+    def _on_destroy(self, *args):
+        self._stream_hub.unsubscribe(self._on_stream_changed)
+
+    def _label_text_for(self, stream):
+        """Applications are labelled by name, devices by description."""
+        if self._is_app:
+            return getattr(stream, "name", stream.description)
+        return stream.description
+
     def _on_stream_changed(self, stream):
         """Update label when stream changes."""
-        label_text = stream.description
-        if hasattr(stream, "type") and "application" in stream.type.lower():
-            label_text = getattr(stream, "name", stream.description)
-        
-        self.stream_label.set_label(f"[{math.ceil(stream.volume)}%] {label_text}")
+        # Volume ticks that round to the same percentage don't need a relayout
+        pct = ceil(stream.volume)
+        label_text = self._label_text_for(stream)
+        if (pct, label_text) == self._last_label:
+            return
+        self._last_label = (pct, label_text)
+        self.stream_label.set_label(f"[{pct}%] {label_text}")
     
     def set_device_active(self, active):
         """Set the device selector active state."""
@@ -302,6 +513,7 @@ class PlaybackTab(Box):
         )
         
         self.audio = audio_service
+        self._controls = {}
         
         # Header
         self.header = Label(
@@ -357,23 +569,19 @@ class PlaybackTab(Box):
     
     def update_applications(self):
         """Update the list of active applications."""
-        # Clear existing content
-        for child in self.content_box.get_children():
-            self.content_box.remove(child)
-        
         # Get active applications
         applications = self.audio.applications if self.audio else []
         
-        if not applications:
-            # Show no applications message
-            self.content_box.add(self.no_apps_label)
-        else:
-            # Add application controls
-            for app in applications:
-                app_control = StreamControl(app)
-                self.content_box.add(app_control)
-        
-        self.content_box.show_all()
+        # Only build controls for applications that weren't shown yet
+        added = _sync_stream_widgets(
+            self.content_box,
+            self._controls,
+            applications,
+            StreamControl,
+            self.no_apps_label,
+        )
+        for widget in added:
+            widget.show_all()
 
 
 class OutputDevicesTab(Box):
@@ -391,6 +599,8 @@ class OutputDevicesTab(Box):
         
         self.audio = audio_service
         self.device_selectors = []
+        self._controls = {}
+        self._active_selector = None
         
         # Header
         self.header = Label(
@@ -443,15 +653,13 @@ class OutputDevicesTab(Box):
         
         # Initialize content
         self.update_devices()
+        
+        # Follow default device switches without rebuilding the list
+        if self.audio:
+            self.audio.connect("notify::speaker", self._on_default_sink_changed)
     
     def update_devices(self):
         """Update the list of output devices."""
-        # Clear existing content
-        for child in self.content_box.get_children():
-            self.content_box.remove(child)
-        
-        self.device_selectors.clear()
-        
         # Get all available output devices (speakers)
         devices = []
         if self.audio:
@@ -462,72 +670,75 @@ class OutputDevicesTab(Box):
             if not devices and self.audio.speaker:
                 devices.append(self.audio.speaker)
         
-        if not devices:
-            # Show no devices message
-            self.content_box.add(self.no_devices_label)
-        else:
-            # Add device controls
-            current_speaker = self.audio.speaker if self.audio else None
-            for i, device in enumerate(devices):
-                device_control = StreamControl(
-                    device,
-                    show_device_selector=True,
-                    on_device_select=self._on_device_select
-                )
-                
-                # Set the current active speaker as active
-                is_active = (current_speaker and device == current_speaker)
-                device_control.set_device_active(is_active)
-                self.device_selectors.append(device_control)
-                
-                self.content_box.add(device_control)
+        # Only build controls for devices that weren't shown yet
+        added = _sync_stream_widgets(
+            self.content_box,
+            self._controls,
+            devices,
+            lambda device: StreamControl(
+                device,
+                show_device_selector=True,
+                on_device_select=self._on_device_select
+            ),
+            self.no_devices_label,
+        )
+        
+        # Set the current active speaker as active
+        self.device_selectors = [self._controls[id(device)] for device in devices]
+        if self._active_selector not in self.device_selectors:
+            self._active_selector = None
+        self._on_default_sink_changed()
         
-        self.content_box.show_all()
+        for widget in added:
+            widget.show_all()
     
-    def _refresh_output_devices(self):
-        """Refresh output devices after a short delay."""
-        self.update_devices()
-        return GLib.SOURCE_REMOVE
+    def _mark_active(self, device):
+        """Move the active marker to device's control, touching only the old and new one."""
+        selector = self._controls.get(id(device)) if device else None
+        if selector is self._active_selector:
+            return
+        if self._active_selector is not None:
+            self._active_selector.set_device_active(False)
+        if selector is not None:
+            selector.set_device_active(True)
+        self._active_selector = selector
+    
+    def _on_default_sink_changed(self, *args):
+        """Mark the new default output device without rebuilding controls."""
+        self._mark_active(self.audio.speaker if self.audio else None)
     
     def _on_device_select(self, device):
         """Handle device selection."""
         # Update device selector states
-        for selector in self.device_selectors:
-            selector.set_device_active(selector.stream == device)
+        self._mark_active(device)
         
         # Actually switch the output device
         try:
             if self.audio:
-                print(f"Attempting to switch to output device: {device.description}")
+                logger.debug("Attempting to switch to output device: %s", device.description)
                 # Use the underlying control to set the default sink
                 if hasattr(self.audio, '_control') and hasattr(device, 'stream'):
                     # For Cvc.MixerSink, we need to set it as the default sink
                     success = self.audio._control.set_default_sink(device.stream)
                     if success:
-                        print(f"Successfully switched to output device: {device.description}")
+                        logger.debug("Successfully switched to output device: %s", device.description)
                     else:
-                        print(f"Failed to switch to output device: {device.description} (set_default_sink returned False)")
+                        logger.warning(
+                            "Failed to switch to output device: %s (set_default_sink returned False)",
+                            device.description,
+                        )
                         # Revert the UI state if switching failed
-                        current_speaker = self.audio.speaker if self.audio else None
-                        for selector in self.device_selectors:
-                            selector.set_device_active(selector.stream == current_speaker)
+                        self._on_default_sink_changed()
                         return
                 else:
-                    print("Control or stream not available for device switching")
+                    logger.warning("Control or stream not available for device switching")
                     # Revert the UI state if switching failed
-                    current_speaker = self.audio.speaker if self.audio else None
-                    for selector in self.device_selectors:
-                        selector.set_device_active(selector.stream == current_speaker)
+                    self._on_default_sink_changed()
                     return
-                
-                # Give the audio service a moment to process the change
-                GLib.timeout_add(100, self._refresh_output_devices)
         except Exception as e:
-            print(f"Failed to switch output device: {e}")
+            logger.warning("Failed to switch output device: %s", e)
             # Revert the UI state if switching failed
-            current_speaker = self.audio.speaker if self.audio else None
-            for selector in self.device_selectors:
-                selector.set_device_active(selector.stream == current_speaker)
+            self._on_default_sink_changed()
 
 
 class InputDevicesTab(Box):
@@ -545,6 +756,8 @@ class InputDevicesTab(Box):
         
         self.audio = audio_service
         self.device_selectors = []
+        self._controls = {}
+        self._active_selector = None
         
         # Header
         self.header = Label(
@@ -597,133 +810,121 @@ class InputDevicesTab(Box):
         
         # Initialize content
         self.update_devices()
+        
+        # Follow default device switches without rebuilding the list
+        if self.audio:
+            self.audio.connect("notify::microphone", self._on_default_source_changed)
     
     def _is_unwanted_device(self, device):
         """Filter out unwanted input devices like monitors, peak detect, cava, etc."""
-        if not hasattr(device, 'description'):
+        description = getattr(device, "description", None)
+        if not description:
             return False
-            
-        description = device.description.lower()
-        
-        # Filter out common unwanted devices
-        unwanted_keywords = [
-            'monitor',
-            'peak detect', 
-            'cava',
-            '.monitor',
-            'echo cancel',
-            'rnnoise',
-            'webrtc',
-            'virtual'
-        ]
-        
-        for keyword in unwanted_keywords:
-            if keyword in description:
-                return True
-                
+
+        if _UNWANTED_RE.search(description.lower()):
+            return True
+
         # Also filter by type if available
-        if hasattr(device, 'type'):
-            device_type = device.type.lower()
-            if 'monitor' in device_type:
-                return True
-                
-        return False
+        return "monitor" in getattr(device, "type", "").lower()
+
+    def _iter_input_devices(self):
+        """Yield (device, is_actual_device) for every input worth listing."""
+        # Use all microphones, not just the active one
+        found_microphone = False
+        for mic in self.audio.microphones or ():
+            if not self._is_unwanted_device(mic):
+                found_microphone = True
+                yield mic, _stream_kind(mic) == StreamKind.MIC
+
+        # If no microphones found but there's an active microphone, include it if it's not unwanted
+        microphone = self.audio.microphone
+        if not found_microphone and microphone and not self._is_unwanted_device(microphone):
+            yield microphone, _stream_kind(microphone) == StreamKind.MIC
+
+        # Add recording applications as well (but filter them too)
+        for recorder in self.audio.recorders or ():
+            if not self._is_unwanted_device(recorder):
+                yield recorder, False
 
     def update_devices(self):
         """Update the list of input devices."""
-        # Clear existing content
-        for child in self.content_box.get_children():
-            self.content_box.remove(child)
-        
-        self.device_selectors.clear()
-        
-        # Get all available input devices (microphones)
-        devices = []
-        if self.audio:
-            # Use all microphones, not just the active one
-            all_mics = self.audio.microphones
-            # Filter out unwanted devices
-            devices.extend([mic for mic in all_mics if not self._is_unwanted_device(mic)])
-            
-            # If no microphones found but there's an active microphone, include it if it's not unwanted
-            if not devices and self.audio.microphone and not self._is_unwanted_device(self.audio.microphone):
-                devices.append(self.audio.microphone)
-            
-            # Add recording applications as well (but filter them too)
-            filtered_recorders = [rec for rec in self.audio.recorders if not self._is_unwanted_device(rec)]
-            devices.extend(filtered_recorders)
+        # Device -> whether it is an actual microphone rather than a recorder app
+        devices = dict(self._iter_input_devices()) if self.audio else {}
         
-        if not devices:
-            # Show no devices message
-            self.content_box.add(self.no_devices_label)
-        else:
-            # Add device controls
-            current_microphone = self.audio.microphone if self.audio else None
-            for i, device in enumerate(devices):
+        # Only build controls for devices that weren't shown yet
+        added = _sync_stream_widgets(
+            self.content_box,
+            self._controls,
+            devices,
+            lambda device: StreamControl(
+                device,
                 # Show device selector for actual microphone devices, not recorder applications
-                is_actual_device = hasattr(device, "type") and "microphone" in device.type.lower()
-                show_selector = is_actual_device
-                
-                device_control = StreamControl(
-                    device,
-                    show_device_selector=show_selector,
-                    on_device_select=self._on_device_select
-                )
-                
-                # Set the current active microphone as active
-                if show_selector:
-                    is_active = (current_microphone and device == current_microphone)
-                    device_control.set_device_active(is_active)
-                    self.device_selectors.append(device_control)
-                
-                self.content_box.add(device_control)
+                show_device_selector=devices[device],
+                on_device_select=self._on_device_select
+            ),
+            self.no_devices_label,
+        )
         
-        self.content_box.show_all()
+        # Set the current active microphone as active
+        self.device_selectors = [
+            self._controls[id(device)]
+            for device, is_actual_device in devices.items()
+            if is_actual_device
+        ]
+        if self._active_selector not in self.device_selectors:
+            self._active_selector = None
+        self._on_default_source_changed()
+        
+        for widget in added:
+            widget.show_all()
     
-    def _refresh_input_devices(self):
-        """Refresh input devices after a short delay."""
-        self.update_devices()
-        return GLib.SOURCE_REMOVE
+    def _mark_active(self, device):
+        """Move the active marker to device's control, touching only the old and new one."""
+        selector = self._controls.get(id(device)) if device else None
+        if selector is self._active_selector:
+            return
+        if self._active_selector is not None:
+            self._active_selector.set_device_active(False)
+        if selector is not None:
+            selector.set_device_active(True)
+        self._active_selector = selector
+    
+    def _on_default_source_changed(self, *args):
+        """Mark the new default input device without rebuilding controls."""
+        self._mark_active(self.audio.microphone if self.audio else None)
     
     def _on_device_select(self, device):
         """Handle device selection."""
         # Update device selector states
-        for selector in self.device_selectors:
-            selector.set_device_active(selector.stream == device)
+        self._mark_active(device)
         
         # Actually switch the input device
         try:
             if self.audio:
-                print(f"Attempting to switch to input device: {device.description}")
+                logger.debug("Attempting to switch to input device: %s", device.description)
                 # Use the underlying control to set the default source
                 if hasattr(self.audio, '_control') and hasattr(device, 'stream'):
                     # For Cvc.MixerSource, we need to set it as the default source
                     success = self.audio._control.set_default_source(device.stream)
                     if success:
-                        print(f"Successfully switched to input device: {device.description}")
+                        logger.debug("Successfully switched to input device: %s", device.description)
                     else:
-                        print(f"Failed to switch to input device: {device.description} (set_default_source returned False)")
+                        logger.warning(
+                            "Failed to switch to input device: %s (set_default_source returned False)",
+                            device.description,
+                        )
                         # Revert the UI state if switching failed
-                        current_microphone = self.audio.microphone if self.audio else None
-                        for selector in self.device_selectors:
-                            selector.set_device_active(selector.stream == current_microphone)
+                        self._on_default_source_changed()
                         return
                 else:
-                    print("Control or stream not available for device switching")
+                    logger.warning("Control or stream not available for device switching")
                     # Revert the UI state if switching failed
-                    current_microphone = self.audio.microphone if self.audio else None
-                    for selector in self.device_selectors:
-                        selector.set_device_active(selector.stream == current_microphone)
+                    self._on_default_source_changed()
                     return
-                
-                # Give the audio service a moment to process the change
-                GLib.timeout_add(100, self._refresh_input_devices)
         except Exception as e:
-            print(f"Failed to switch input device: {e}")
+            logger.warning("Failed to switch input device: %s", e)
             # Revert the UI state if switching failed
-            current_microphone = self.audio.microphone if self.audio else None
-            for selector in self.device_selectors:
-                selector.set_device_active(selector.stream == current_microphone)
+            self._on_default_source_changed()
 
 
 class MixerSection(Box):
@@ -751,43 +952,43 @@ class MixerSection(Box):
             v_expand=False,  # Prevent vertical stretching
         )
 
+        # Rows keyed by id(stream), reused across updates
+        self._rows = {}
+
         self.add(self.title_label)
         self.add(self.content_box)
 
     def update_streams(self, streams):
-        for child in self.content_box.get_children():
-            self.content_box.remove(child)
-
-        for stream in streams:
-            label_text = stream.description
-            if hasattr(stream, "type") and "application" in stream.type.lower():
-                label_text = getattr(stream, "name", stream.description)
-
-            stream_container = Box(
-                orientation="v",
-                spacing=4,
-                h_expand=True,
-                v_expand=False,  # Prevent vertical stretching
-            )
+        added = _sync_stream_widgets(
+            self.content_box, self._rows, streams, self._build_stream_row
+        )
+        for widget in added:
+            widget.show_all()
 
-            label = Label(
-                name="mixer-stream-label",
-                label=f"[{math.ceil(stream.volume)}%] {stream.description}",
-                h_expand=True,
-                h_align="start",
-                v_align="center",
-                ellipsization="end",
-                max_chars_width=45,
-                height_request=20,  # Fixed height for labels
-            )
+    def _build_stream_row(self, stream):
+        stream_container = Box(
+            orientation="v",
+            spacing=4,
+            h_expand=True,
+            v_expand=False,  # Prevent vertical stretching
+        )
 
-            slider = MixerSlider(stream)
+        label = Label(
+            name="mixer-stream-label",
+            label=f"[{ceil(stream.volume)}%] {stream.description}",
+            h_expand=True,
+            h_align="start",
+            v_align="center",
+            ellipsization="end",
+            max_chars_width=45,
+            height_request=20,  # Fixed height for labels
+        )
 
-            stream_container.add(label)
-            stream_container.add(slider)
-            self.content_box.add(stream_container)
+        slider = MixerSlider(stream)
 
-        self.content_box.show_all()
+        stream_container.add(label)
+        stream_container.add(slider)
+        return stream_container
 
 
 class Mixer(Box):
@@ -844,15 +1045,24 @@ class Mixer(Box):
             spacing=8,
         )
 
-        # Create the three tabs
+        # Create the three tabs. Playback is shown first; the device tabs are
+        # only built the first time they're switched to.
         self.playback_tab = PlaybackTab(self.audio)
-        self.output_devices_tab = OutputDevicesTab(self.audio)
-        self.input_devices_tab = InputDevicesTab(self.audio)
+        self.output_devices_tab = None
+        self.input_devices_tab = None
+        self._tab_builders = {
+            "output-devices": ("output_devices_tab", OutputDevicesTab),
+            "input-devices": ("input_devices_tab", InputDevicesTab),
+        }
+        self._tab_slots = {
+            name: Box(h_expand=True, v_expand=True) for name in self._tab_builders
+        }
 
         # Add tabs to stack
         self.stack.add_titled(self.playback_tab, "playback", "Playback")
-        self.stack.add_titled(self.output_devices_tab, "output-devices", "Output Devices")
-        self.stack.add_titled(self.input_devices_tab, "input-devices", "Input Devices")
+        self.stack.add_titled(self._tab_slots["output-devices"], "output-devices", "Output Devices")
+        self.stack.add_titled(self._tab_slots["input-devices"], "input-devices", "Input Devices")
+        self.stack.connect("notify::visible-child-name", self._on_visible_tab_changed)
 
         # Configure switcher
         self.switcher.set_stack(self.stack)
@@ -864,9 +1074,16 @@ class Mixer(Box):
         self.add(self.switcher)
         self.add(self.stack)
 
+        self._switcher_by_text = None
         # Setup switcher icons for vertical mode
         if vertical_mode:
-            GLib.idle_add(self._setup_switcher_icons)
+            self._setup_switcher_icons()
+
+        # Audio events arrive in bursts and only the visible tab is refreshed
+        # right away; the others stay dirty until they're switched to
+        self._dirty_tabs = set()
+        self._pending_update_id = 0
+        self.connect("destroy", self._on_destroy)
 
         # Connect to audio service changes
         self.audio.connect("changed", self.on_audio_changed)
@@ -887,32 +1104,45 @@ class Mixer(Box):
             "Input Devices": {"icon": icons.mic, "name": "input-devices"},
         }
 
-        buttons = self.switcher.get_children()
-        for btn in buttons:
-            if isinstance(btn, Gtk.ToggleButton):
-                original_gtk_label = None
-                for child_widget in btn.get_children():
-                    if isinstance(child_widget, Gtk.Label):
-                        original_gtk_label = child_widget
-                        break
-
-                if original_gtk_label:
-                    label_text = original_gtk_label.get_text()
-                    if label_text in icon_details_map:
-                        details = icon_details_map[label_text]
-                        icon_markup = details["icon"]
-                        css_name_suffix = details["name"]
-
-                        btn.remove(original_gtk_label)
-
-                        new_icon_label = Label(
-                            name=f"mixer-switcher-icon-{css_name_suffix}", 
-                            markup=icon_markup
-                        )
-                        btn.add(new_icon_label)
-                        new_icon_label.show_all()
-        
-        return GLib.SOURCE_REMOVE
+        # Map each switcher button by its original title once; the titles are
+        # gone after the first pass swaps them for icons
+        if self._switcher_by_text is None:
+            self._switcher_by_text = {}
+            for btn in self.switcher.get_children():
+                child = btn.get_child() if isinstance(btn, Gtk.ToggleButton) else None
+                if isinstance(child, Gtk.Label):
+                    self._switcher_by_text[child.get_text()] = btn
+
+        for label_text, details in icon_details_map.items():
+            btn = self._switcher_by_text.get(label_text)
+            if btn is None:
+                continue
+
+            btn.remove(btn.get_child())
+
+            new_icon_label = Label(
+                name=f"mixer-switcher-icon-{details['name']}", 
+                markup=details["icon"]
+            )
+            btn.add(new_icon_label)
+            new_icon_label.show_all()
+    
+    def _on_visible_tab_changed(self, *args):
+        self._materialize_tab()
+        self._refresh_visible()
+    
+    def _materialize_tab(self):
+        """Build a device tab inside its placeholder the first time it's shown."""
+        name = self.stack.get_visible_child_name()
+        if name not in self._tab_builders:
+            return
+        attr, tab_class = self._tab_builders.pop(name)
+        tab = tab_class(self.audio)
+        setattr(self, attr, tab)
+        self._tab_slots[name].add(tab)
+        tab.show_all()
+        # A freshly built tab is already up to date
+        self._dirty_tabs.discard(name)
     
     def _delayed_update(self):
         """Delayed update for when audio service is connecting."""
@@ -921,29 +1151,55 @@ class Mixer(Box):
     
     def on_audio_changed(self, *args):
         """Handle audio service changes and update all tabs."""
-        self.update_all_tabs()
+        self._queue_update("playback", "output-devices", "input-devices")
     
     def on_speaker_changed(self, *args):
         """Handle speaker device changes."""
         # Only update output devices tab for better performance
-        self.output_devices_tab.update_devices()
+        self._queue_update("output-devices")
     
     def on_microphone_changed(self, *args):
         """Handle microphone device changes."""
         # Only update input devices tab for better performance
-        self.input_devices_tab.update_devices()
+        self._queue_update("input-devices")
+    
+    def _queue_update(self, *tab_names):
+        """Mark tabs dirty and refresh the visible one, coalescing events within 50ms."""
+        self._dirty_tabs.update(tab_names)
+        if not self._pending_update_id:
+            self._pending_update_id = GLib.timeout_add(50, self._flush_update)
+    
+    def _flush_update(self):
+        self._pending_update_id = 0
+        self._refresh_visible()
+        return GLib.SOURCE_REMOVE
+    
+    def _refresh_visible(self):
+        """Refresh the visible tab if it has changes it hasn't shown yet."""
+        name = self.stack.get_visible_child_name()
+        if name not in self._dirty_tabs:
+            return
+        self._dirty_tabs.discard(name)
+
+        if name == "playback":
+            self.playback_tab.update_applications()
+        elif name == "output-devices" and self.output_devices_tab is not None:
+            self.output_devices_tab.update_devices()
+        elif name == "input-devices" and self.input_devices_tab is not None:
+            self.input_devices_tab.update_devices()
+    
+    def _on_destroy(self, *args):
+        if self._pending_update_id:
+            GLib.source_remove(self._pending_update_id)
+            self._pending_update_id = 0
     
     def update_all_tabs(self):
-        """Update content in all tabs."""
-        self.playback_tab.update_applications()
-        self.output_devices_tab.update_devices()
-        self.input_devices_tab.update_devices()
+        """Update the visible tab now and the others when they're next shown."""
+        self._dirty_tabs.update(("playback", "output-devices", "input-devices"))
+        self._refresh_visible()
     
     def go_to_tab(self, tab_name):
         """Navigate to a specific tab."""
-        if tab_name == "playback":
-            self.stack.set_visible_child(self.playback_tab)
-        elif tab_name == "output-devices":
-            self.stack.set_visible_child(self.output_devices_tab)
-        elif tab_name == "input-devices":
-            self.stack.set_visible_child(self.input_devices_tab)
+        # Switching by name also builds a device tab on first use
+        if tab_name in ("playback", "output-devices", "input-devices"):
+            self.stack.set_visible_child_name(tab_name)
@@ -21,9 +21,7 @@ from utils.icon_resolver import IconResolver
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gdk, Gtk
 
-screen = Gdk.Screen.get_default()
-CURRENT_WIDTH = screen.get_width()
-CURRENT_HEIGHT = screen.get_height()
+CURRENT_WIDTH, CURRENT_HEIGHT = data.get_screen_size()
 
 icon_resolver = IconResolver()
 connection = Hyprland()
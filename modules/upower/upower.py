@@ -1,5 +1,24 @@
+import functools
+
 import dbus
 
+
+def _drop_proxies_on_error(method):
+    """Forget the cached proxies when a call fails, then re-raise.
+
+    Proxies are bound to upowerd's unique bus name, so after it restarts they
+    fail for good; the next call creates new ones.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except dbus.exceptions.DBusException:
+            self._proxies.clear()
+            raise
+    return wrapper
+
+
 class UPowerManager():
 
     def __init__(self):
@@ -8,36 +27,51 @@ class UPowerManager():
 
         self.DBUS_PROPERTIES = "org.freedesktop.DBus.Properties"
         self.bus = dbus.SystemBus()
-
+        self._proxies = {}
+
+    def _get_proxy(self, path):
+        # Proxies are reused and skip introspection (an extra round trip per
+        # get_object call), since every call below names its interface
+        proxy = self._proxies.get(path)
+        if proxy is None:
+            proxy = self.bus.get_object(self.UPOWER_NAME, path, introspect=False)
+            self._proxies[path] = proxy
+        return proxy
+
+    @_drop_proxies_on_error
     def detect_devices(self):
-        upower_proxy = self.bus.get_object(self.UPOWER_NAME, self.UPOWER_PATH)
+        upower_proxy = self._get_proxy(self.UPOWER_PATH)
         upower_interface = dbus.Interface(upower_proxy, self.UPOWER_NAME)
 
         devices = upower_interface.EnumerateDevices()
         return devices
 
+    @_drop_proxies_on_error
     def get_display_device(self):
-        upower_proxy = self.bus.get_object(self.UPOWER_NAME, self.UPOWER_PATH)
+        upower_proxy = self._get_proxy(self.UPOWER_PATH)
         upower_interface = dbus.Interface(upower_proxy, self.UPOWER_NAME)
 
         dispdev = upower_interface.GetDisplayDevice()
         return dispdev
 
+    @_drop_proxies_on_error
     def get_critical_action(self):
-        upower_proxy = self.bus.get_object(self.UPOWER_NAME, self.UPOWER_PATH)
+        upower_proxy = self._get_proxy(self.UPOWER_PATH)
         upower_interface = dbus.Interface(upower_proxy, self.UPOWER_NAME)
 
         critical_action = upower_interface.GetCriticalAction()
         return critical_action
 
+    @_drop_proxies_on_error
     def get_device_percentage(self, battery):
-        battery_proxy = self.bus.get_object(self.UPOWER_NAME, battery)
+        battery_proxy = self._get_proxy(battery)
         battery_proxy_interface = dbus.Interface(battery_proxy, self.DBUS_PROPERTIES)
 
         return battery_proxy_interface.Get(self.UPOWER_NAME + ".Device", "Percentage")
 
+    @_drop_proxies_on_error
     def get_full_device_information(self, battery):
-        battery_proxy = self.bus.get_object(self.UPOWER_NAME, battery)
+        battery_proxy = self._get_proxy(battery)
         battery_proxy_interface = dbus.Interface(battery_proxy, self.DBUS_PROPERTIES)
 
         # Use GetAll to retrieve all properties in a single DBus call
@@ -77,50 +111,57 @@ class UPowerManager():
 
         return information_table
 
+    @_drop_proxies_on_error
     def is_lid_present(self):
-        upower_proxy = self.bus.get_object(self.UPOWER_NAME, self.UPOWER_PATH)
+        upower_proxy = self._get_proxy(self.UPOWER_PATH)
         upower_interface = dbus.Interface(upower_proxy, self.DBUS_PROPERTIES)
 
         is_lid_present = bool(upower_interface.Get(self.UPOWER_NAME, 'LidIsPresent'))
         return is_lid_present
 
+    @_drop_proxies_on_error
     def is_lid_closed(self):
-        upower_proxy = self.bus.get_object(self.UPOWER_NAME, self.UPOWER_PATH)
+        upower_proxy = self._get_proxy(self.UPOWER_PATH)
         upower_interface = dbus.Interface(upower_proxy, self.DBUS_PROPERTIES)
 
         is_lid_closed = bool(upower_interface.Get(self.UPOWER_NAME, 'LidIsClosed'))
         return is_lid_closed
 
+    @_drop_proxies_on_error
     def on_battery(self):
-        upower_proxy = self.bus.get_object(self.UPOWER_NAME, self.UPOWER_PATH)
+        upower_proxy = self._get_proxy(self.UPOWER_PATH)
         upower_interface = dbus.Interface(upower_proxy, self.DBUS_PROPERTIES)
 
         on_battery = bool(upower_interface.Get(self.UPOWER_NAME, 'OnBattery'))
         return on_battery
 
+    @_drop_proxies_on_error
     def has_wakeup_capabilities(self):
-        upower_proxy = self.bus.get_object(self.UPOWER_NAME, self.UPOWER_PATH + "/Wakeups")
+        upower_proxy = self._get_proxy(self.UPOWER_PATH + "/Wakeups")
         upower_interface = dbus.Interface(upower_proxy, self.DBUS_PROPERTIES)
 
         has_wakeup_capabilities = bool(upower_interface.Get(self.UPOWER_NAME+ '.Wakeups', 'HasCapability'))
         return has_wakeup_capabilities
 
+    @_drop_proxies_on_error
     def get_wakeups_data(self):
-        upower_proxy = self.bus.get_object(self.UPOWER_NAME, self.UPOWER_PATH + "/Wakeups")
+        upower_proxy = self._get_proxy(self.UPOWER_PATH + "/Wakeups")
         upower_interface = dbus.Interface(upower_proxy, self.UPOWER_NAME + '.Wakeups')
 
         data = upower_interface.GetData()
         return data
 
+    @_drop_proxies_on_error
     def get_wakeups_total(self):
-        upower_proxy = self.bus.get_object(self.UPOWER_NAME, self.UPOWER_PATH + "/Wakeups")
+        upower_proxy = self._get_proxy(self.UPOWER_PATH + "/Wakeups")
         upower_interface = dbus.Interface(upower_proxy, self.UPOWER_NAME + '.Wakeups')
 
         data = upower_interface.GetTotal()
         return data
 
+    @_drop_proxies_on_error
     def is_loading(self, battery):
-        battery_proxy = self.bus.get_object(self.UPOWER_NAME, battery)
+        battery_proxy = self._get_proxy(battery)
         battery_proxy_interface = dbus.Interface(battery_proxy, self.DBUS_PROPERTIES)
 
         state = int(battery_proxy_interface.Get(self.UPOWER_NAME + ".Device", "State"))
@@ -130,8 +171,9 @@ class UPowerManager():
         else:
             return False
 
+    @_drop_proxies_on_error
     def get_state(self, battery):
-        battery_proxy = self.bus.get_object(self.UPOWER_NAME, battery)
+        battery_proxy = self._get_proxy(battery)
         battery_proxy_interface = dbus.Interface(battery_proxy, self.DBUS_PROPERTIES)
 
         state = int(battery_proxy_interface.Get(self.UPOWER_NAME + ".Device", "State"))
@@ -1,5 +1,9 @@
-import subprocess
-import urllib.parse
+import http.client
+import json
+import os
+import queue
+import threading
+import time
 
 import gi
 from fabric.widgets.button import Button
@@ -10,6 +14,30 @@ gi.require_version("Gtk", "3.0")
 import config.data as data
 import modules.icons as icons
 
+CACHE_FILE = os.path.join(data.CACHE_DIR, "weather.json")
+CACHE_MAX_AGE = 600  # Same as the refresh interval
+
+# A single worker serializes fetches and is reused across refreshes. It is a
+# daemon thread, so a fetch still in flight doesn't hold up quitting the shell
+_weather_jobs = queue.SimpleQueue()
+_weather_worker = None
+
+
+def _run_weather_jobs():
+    while True:
+        _weather_jobs.get()()
+
+
+def _submit_weather_job(job):
+    """Run job on the shared weather worker, starting it on first use"""
+    global _weather_worker
+    if _weather_worker is None:
+        _weather_worker = threading.Thread(
+            target=_run_weather_jobs, name="weather", daemon=True
+        )
+        _weather_worker.start()
+    _weather_jobs.put(job)
+
 
 class Weather(Button):
     def __init__(self, **kwargs) -> None:
@@ -19,11 +47,18 @@ class Weather(Button):
         self.show_all()
         self.enabled = False  # Will be set by apply_component_props
         self.has_weather_data = False
-        self.fetching = False  # Prevent concurrent fetches
-        # Fetch weather every 10 minutes (600 seconds)
-        GLib.timeout_add_seconds(600, self.fetch_weather)
-        # Delay initial fetch to allow visibility config to be applied first (runs only once)
-        GLib.timeout_add(100, self._initial_fetch)
+        self._fetching = False  # Prevents concurrent fetches, main thread only
+        # A recent cached result stands in for the initial fetch, otherwise
+        # it starts once the bar applies our visibility (see set_visible)
+        cache_age = self._load_cache()
+        if cache_age is None:
+            # Fetch weather every 10 minutes (600 seconds)
+            GLib.timeout_add_seconds(600, self.fetch_weather)
+        else:
+            # Refresh once the cached result is 10 minutes old, then as usual
+            GLib.timeout_add_seconds(
+                max(1, int(CACHE_MAX_AGE - cache_age)), self._start_refresh_timer
+            )
 
     def set_visible(self, visible):
         """Override to track external visibility setting"""
@@ -37,70 +72,115 @@ class Weather(Button):
         # If being enabled, only show if we have weather data
         if hasattr(self, "has_weather_data") and self.has_weather_data:
             super().set_visible(True)
-        # If no weather data yet, remain hidden until fetch completes
+        elif hasattr(self, "_fetching"):
+            # If no weather data yet, remain hidden until fetch completes
+            self.fetch_weather()
 
-    def _initial_fetch(self):
-        """Initial fetch that runs only once"""
+    def _start_refresh_timer(self):
         self.fetch_weather()
-        return False  # Don't repeat this timeout
+        GLib.timeout_add_seconds(600, self.fetch_weather)
+        return GLib.SOURCE_REMOVE
+
+    def _load_cache(self):
+        """Show the last saved result if it is still fresh, returning its age (or None)"""
+        try:
+            with open(CACHE_FILE) as f:
+                cached = json.load(f)
+            if cached["vertical"] != data.VERTICAL:
+                return None
+            age = time.time() - cached["ts"]
+            if not 0 <= age < CACHE_MAX_AGE:
+                return None
+            weather_data = cached["weather_data"]
+            tooltip_text = cached["tooltip_text"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        self.has_weather_data = True
+        self.label.set_label(weather_data.replace(" ", ""))
+        if tooltip_text:
+            self.set_tooltip_text(tooltip_text)
+        return age
+
+    def _save_cache(self, weather_data, tooltip_text):
+        try:
+            os.makedirs(data.CACHE_DIR, exist_ok=True)
+            tmp_path = f"{CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "ts": time.time(),
+                        "vertical": data.VERTICAL,
+                        "weather_data": weather_data,
+                        "tooltip_text": tooltip_text,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, CACHE_FILE)
+        except OSError as e:
+            print(f"Error writing weather cache: {e}")
 
     def fetch_weather(self):
         # Prevent concurrent fetches
-        if self.fetching:
+        if self._fetching:
             return True
 
-        self.fetching = True
-        GLib.Thread.new("weather-fetch", self._fetch_weather_thread, None)
+        self._fetching = True
+        _submit_weather_job(self._fetch_weather_blocking)
         return True
 
-    def _fetch_weather_thread(self, user_data):
-        url = (
-            "https://wttr.in/?format=%c+%t"
-            if not data.VERTICAL
-            else "https://wttr.in/?format=%c"
-        )
+    def _fetch_weather_blocking(self):
+        path = "/?format=%c+%t" if not data.VERTICAL else "/?format=%c"
 
-        tooltip_url = "https://wttr.in/?format=%l:+%C,+%t+(%f),+Humidity:+%h,+Wind:+%w"
+        tooltip_path = "/?format=%l:+%C,+%t+(%f),+Humidity:+%h,+Wind:+%w"
 
+        # Both requests share one keep-alive connection (and TLS handshake)
+        conn = http.client.HTTPSConnection("wttr.in", timeout=5)
         try:
-            # Use curl to fetch weather data
-            result = subprocess.run(
-                ["curl", "-sf", "--max-time", "5", url],
-                capture_output=True,
-                text=True,
-                timeout=6,
-            )
+            weather_data = self._request(conn, path)
 
-            if result.returncode == 0 and result.stdout:
-                weather_data = result.stdout.strip()
+            if weather_data:
                 if "Unknown" in weather_data:
-                    self.has_weather_data = False
-                    GLib.idle_add(self.set_visible, False)
+                    GLib.idle_add(self._apply_result, None)
                 else:
-                    self.has_weather_data = True
-
-                    # Fetch tooltip data
-                    tooltip_result = subprocess.run(
-                        ["curl", "-sf", "--max-time", "5", tooltip_url],
-                        capture_output=True,
-                        text=True,
-                        timeout=6,
-                    )
-                    if tooltip_result.returncode == 0 and tooltip_result.stdout:
-                        tooltip_text = tooltip_result.stdout.strip()
-                        GLib.idle_add(self.set_tooltip_text, tooltip_text)
-
-                    GLib.idle_add(self.set_visible, self.enabled)
-                    GLib.idle_add(self.label.set_label, weather_data.replace(" ", ""))
+                    # Fetch tooltip data, the weather is still shown without it
+                    try:
+                        tooltip_text = self._request(conn, tooltip_path)
+                    except Exception as e:
+                        print(f"Error fetching weather tooltip: {e}")
+                        tooltip_text = None
+
+                    self._save_cache(weather_data, tooltip_text)
+
+                    GLib.idle_add(self._apply_result, weather_data.replace(" ", ""), tooltip_text)
             else:
-                self.has_weather_data = False
-                GLib.idle_add(self.label.set_markup, f"{icons.cloud_off} Unavailable")
-                GLib.idle_add(self.set_visible, False)
+                GLib.idle_add(self._apply_result, None, None, f"{icons.cloud_off} Unavailable")
         except Exception as e:
-            self.has_weather_data = False
             print(f"Error fetching weather: {e}")
-            GLib.idle_add(self.label.set_markup, f"{icons.cloud_off} Error")
-            GLib.idle_add(self.set_visible, False)
+            GLib.idle_add(self._apply_result, None, None, f"{icons.cloud_off} Error")
         finally:
-            # Always reset fetching flag when done
-            self.fetching = False
\ No newline at end of file
+            conn.close()
+
+    def _apply_result(self, label, tooltip_text=None, error_markup=None):
+        """Show a fetch result on the main thread, hiding the widget if there is none"""
+        self._fetching = False
+        self.has_weather_data = label is not None
+        if label is not None:
+            if tooltip_text:
+                self.set_tooltip_text(tooltip_text)
+            self.label.set_label(label)
+        elif error_markup:
+            self.label.set_markup(error_markup)
+
+        # Calling set_visible() here would overwrite whether the bar enabled us
+        super().set_visible(self.enabled and self.has_weather_data)
+        return GLib.SOURCE_REMOVE
+
+    @staticmethod
+    def _request(conn, path):
+        """GET path on conn, returning the stripped body or None on HTTP errors"""
+        # wttr.in only answers with plain text for console user agents
+        conn.request("GET", path, headers={"User-Agent": "curl"})
+        response = conn.getresponse()
+        body = response.read().decode().strip()
+        return body if response.status == 200 else None
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+
+"""
+Precompute the resolved settings into config/_generated.py so the shell
+can import them without parsing config.json on startup.
+"""
+
+import os
+import sys
+
+# Add the Rz-Shell directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from config.data import GENERATED_FILE, write_generated_config
+
+    write_generated_config()
+    print(f"Wrote {GENERATED_FILE}")
+except Exception as e:
+    print(f"Error generating config module: {e}")
+    sys.exit(1)
@@ -1,24 +1,38 @@
+import os
+import shlex
+import threading
 import time
 from fabric.core.service import Service, Signal
-from gi.repository import GLib
+from gi.repository import Gio, GLib
 from loguru import logger
 
 from modules.upower.upower import UPowerManager
 from services.brightness import Brightness
 from utils.functions import send_notification
-from config.data import load_config
+from config.data import CONFIG_FILE, load_config
+
+CPUFREQ_GOVERNOR_GLOB = "/sys/devices/system/cpu/cpu*/cpufreq/scaling_governor"
+CPUFREQ_AVAILABLE_GOVERNORS = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_available_governors"
+
+# Governors to use for each mode, in order of preference
+PREFERRED_GOVERNORS = {
+    "powersave": ("powersave", "conservative"),
+    "performance": ("performance", "ondemand", "schedutil"),
+}
 
 
 class PowerManagerService(Service):
     """Service for power management including low battery notifications and power controls."""
     
     instance = None
+    _lock = threading.Lock()
     
     @staticmethod
     def get_initial():
         """Singleton to get PowerManagerService instance."""
-        if PowerManagerService.instance is None:
-            PowerManagerService.instance = PowerManagerService()
+        with PowerManagerService._lock:
+            if PowerManagerService.instance is None:
+                PowerManagerService.instance = PowerManagerService()
         return PowerManagerService.instance
 
     @Signal
@@ -34,43 +48,134 @@ class PowerManagerService(Service):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.upower = UPowerManager()
-        self.brightness_service = None
+        self._brightness_service = None
+        self._brightness_probed = False
         self.last_battery_level = -1
         self.last_charging_state = None
         self.notified_levels = set()  # Track which levels we've already notified about
         self.battery_timer = None
+        self._system_bus = None
+        self._signal_subscriptions = []
+        self._battery_path = None
         self.brightness_dimmed = False
         self.original_brightness = None
         self.suspend_warning_sent = False
         self.suspend_timer = None
         self.performance_mode_set = False
+        self._governor_for = self._probe_governors()
+        self._last_notification_inputs = None
+        self._last_perf_inputs = None
+        self._config_cache = None
+        self._config_mtime = 0
+        self._sorted_levels = ()
+        self._config_monitor = None
         
-        # Initialize brightness service
+        # Drop the cached config whenever the file changes on disk
         try:
-            self.brightness_service = Brightness.get_initial()
-        except Exception as e:
-            logger.warning(f"Could not initialize brightness service: {e}")
+            self._config_monitor = Gio.File.new_for_path(CONFIG_FILE).monitor_file(
+                Gio.FileMonitorFlags.NONE, None
+            )
+            self._config_monitor.connect("changed", self._on_config_changed)
+        except GLib.Error as e:
+            logger.warning(f"Could not monitor config file, checking its mtime instead: {e}")
         
         # Start monitoring battery
         self._start_battery_monitoring()
 
+    @property
+    def brightness_service(self):
+        """Brightness service, initialized the first time it's needed."""
+        if not self._brightness_probed:
+            self._brightness_probed = True
+            try:
+                self._brightness_service = Brightness.get_initial()
+            except Exception as e:
+                logger.warning(f"Could not initialize brightness service: {e}")
+        return self._brightness_service
+
     def _start_battery_monitoring(self):
-        """Start periodic battery monitoring."""
-        self.battery_timer = GLib.timeout_add(5000, self._check_battery_status)  # Check every 5 seconds
+        """React to UPower property changes, polling slowly as a safety net."""
+        try:
+            self._system_bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+            for interface, signal, callback in (
+                ("org.freedesktop.DBus.Properties", "PropertiesChanged", self._on_properties_changed),
+                ("org.freedesktop.UPower", "DeviceAdded", self._on_devices_changed),
+                ("org.freedesktop.UPower", "DeviceRemoved", self._on_devices_changed),
+            ):
+                self._signal_subscriptions.append(self._system_bus.signal_subscribe(
+                    "org.freedesktop.UPower",  # sender
+                    interface,
+                    signal,
+                    None,  # any UPower object path
+                    None,  # arg0
+                    Gio.DBusSignalFlags.NONE,
+                    callback,
+                    None
+                ))
+            interval = 60  # Signals do the work, only poll once a minute
+        except GLib.Error as e:
+            logger.warning(f"Could not subscribe to UPower signals, polling instead: {e}")
+            interval = 5
+
+        self._check_battery_status()
+        self.battery_timer = GLib.timeout_add_seconds(interval, self._check_battery_status)
+
+    def _on_properties_changed(self, connection, sender_name, object_path, interface_name, signal_name, parameters, user_data):
+        """Re-check the battery when it or the power source changes state."""
+        changed_interface, changed, invalidated = parameters.unpack()
+        if changed_interface == "org.freedesktop.UPower":
+            relevant = ("OnBattery",)
+        elif changed_interface == "org.freedesktop.UPower.Device" and (
+            self._battery_path is None or object_path == self._battery_path
+        ):
+            relevant = ("Percentage", "State")
+        else:
+            return  # Other devices, the display device, line power...
+
+        # Skip the frequent EnergyRate/Voltage/TimeToEmpty updates
+        if any(name in changed or name in invalidated for name in relevant):
+            self._check_battery_status()
+
+    def _on_devices_changed(self, connection, sender_name, object_path, interface_name, signal_name, parameters, user_data):
+        """Forget the cached battery path when devices come and go."""
+        self._battery_path = None
+        self._check_battery_status()
+
+    def _resolve_battery_path(self):
+        """Find the first battery device and remember its object path."""
+        for device in self.upower.detect_devices():
+            device_info = self.upower.get_full_device_information(device)
+            if device_info.get('Type') == 2:  # Battery type
+                self._battery_path = device
+                break
+        return self._battery_path
+
+    def _on_config_changed(self, monitor, file, other_file, event_type):
+        self._config_cache = None
+
+    def _get_power_config(self):
+        """Return the power_controls config, re-reading it only when the file changes."""
+        if self._config_monitor is None:
+            try:
+                mtime = os.stat(CONFIG_FILE).st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime != self._config_mtime:
+                self._config_cache = None
+                self._config_mtime = mtime
+        
+        if self._config_cache is None:
+            self._config_cache = load_config().get("power_controls", {})
+            # Notification levels, highest first
+            self._sorted_levels = tuple(
+                sorted(self._config_cache.get("notification_levels", [20, 10, 5]), reverse=True)
+            )
+        return self._config_cache
 
     def _check_battery_status(self):
         """Check current battery status and handle notifications/power controls."""
         try:
-            # Get battery devices
-            devices = self.upower.detect_devices()
-            battery_device = None
-            
-            # Find the first battery device
-            for device in devices:
-                device_info = self.upower.get_full_device_information(device)
-                if device_info.get('Type') == 2:  # Battery type
-                    battery_device = device
-                    break
+            battery_device = self._battery_path or self._resolve_battery_path()
             
             if not battery_device:
                 return True  # Continue monitoring
@@ -88,16 +193,19 @@ class PowerManagerService(Service):
                 # Handle charging state change - reset notifications when plugged in
                 if is_charging and not self.last_charging_state:
                     self.notified_levels.clear()
+                    self._last_notification_inputs = None
                     self._restore_brightness()
                 
                 self.last_battery_level = battery_level
                 self.last_charging_state = is_charging
             
+            power_config = self._get_power_config()
+            
             # Only process low battery warnings when on battery power
             if is_on_battery and not is_charging:
-                self._handle_low_battery_notifications(battery_level)
-                self._handle_power_controls(battery_level)
-                self._handle_auto_suspend(battery_level)
+                self._handle_low_battery_notifications(battery_level, power_config)
+                self._handle_power_controls(battery_level, power_config)
+                self._handle_auto_suspend(battery_level, power_config)
             else:
                 # Cancel suspend timer if charging
                 if self.suspend_timer:
@@ -106,39 +214,41 @@ class PowerManagerService(Service):
                     self.suspend_warning_sent = False
             
             # Handle performance mode regardless of power source
-            self._handle_performance_mode(battery_level, is_on_battery)
+            self._handle_performance_mode(battery_level, is_on_battery, power_config)
             
             return True  # Continue monitoring
             
         except Exception as e:
             logger.error(f"Error checking battery status: {e}")
+            self._battery_path = None  # Rescan in case the device went away
             return True  # Continue monitoring despite errors
 
-    def _handle_low_battery_notifications(self, battery_level):
+    def _handle_low_battery_notifications(self, battery_level, power_config):
         """Handle low battery notifications based on config."""
-        config = load_config()
-        power_config = config.get("power_controls", {})
+        # Nothing new to notify about until the level or config changes
+        inputs = (battery_level, power_config)
+        if inputs == self._last_notification_inputs:
+            return
         
-        # Default notification levels
-        notification_levels = power_config.get("notification_levels", [20, 10, 5])
         enable_notifications = power_config.get("enable_low_battery_notifications", True)
         
         if not enable_notifications:
             return
         
-        # Check each notification level
-        for level in notification_levels:
-            if battery_level <= level and level not in self.notified_levels:
-                self._send_low_battery_notification(battery_level)
+        # Check each level at or above the battery level, highest first
+        for level in self._sorted_levels:
+            if level < battery_level:
+                break
+            if level not in self.notified_levels:
+                self._send_low_battery_notification(battery_level, power_config)
                 self.notified_levels.add(level)
                 self.emit("low_battery_warning", battery_level)
-                break  # Only notify for the highest level reached
+                return  # Only notify for the highest level reached
+        
+        self._last_notification_inputs = inputs
 
-    def _send_low_battery_notification(self, battery_level):
+    def _send_low_battery_notification(self, battery_level, power_config):
         """Send low battery notification."""
-        config = load_config()
-        power_config = config.get("power_controls", {})
-        
         # Determine urgency and message based on level
         if battery_level <= 5:
             urgency = "critical"
@@ -170,19 +280,17 @@ class PowerManagerService(Service):
         except Exception as e:
             logger.error(f"Failed to send low battery notification: {e}")
 
-    def _handle_power_controls(self, battery_level):
+    def _handle_power_controls(self, battery_level, power_config):
         """Handle automatic power controls based on battery level."""
-        config = load_config()
-        power_config = config.get("power_controls", {})
-        
         enable_auto_dim = power_config.get("enable_auto_dim", True)
         dim_trigger_level = power_config.get("dim_trigger_level", 20)
         dim_brightness_level = power_config.get("dim_brightness_level", 30)
         
-        if not enable_auto_dim or not self.brightness_service:
+        if not enable_auto_dim:
             return
         
-        # Trigger dimming when battery hits the configured level
+        # Trigger dimming when battery hits the configured level. The brightness
+        # service is only probed (in _dim_brightness) once dimming is needed
         if battery_level <= dim_trigger_level and not self.brightness_dimmed:
             self._dim_brightness(dim_brightness_level)
         elif battery_level > dim_trigger_level and self.brightness_dimmed:
@@ -207,7 +315,7 @@ class PowerManagerService(Service):
     def _restore_brightness(self):
         """Restore original brightness level."""
         try:
-            if not self.brightness_service or not self.brightness_dimmed:
+            if not self.brightness_dimmed or not self.brightness_service:
                 return
             
             if self.original_brightness is not None:
@@ -222,26 +330,22 @@ class PowerManagerService(Service):
     def get_battery_info(self):
         """Get current battery information."""
         try:
-            devices = self.upower.detect_devices()
-            for device in devices:
-                device_info = self.upower.get_full_device_information(device)
-                if device_info.get('Type') == 2:  # Battery type
-                    return {
-                        'percentage': int(device_info.get('Percentage', 0)),
-                        'is_charging': device_info.get('State') == 1,
-                        'is_on_battery': self.upower.on_battery(),
-                        'time_to_empty': device_info.get('TimeToEmpty', 0),
-                        'time_to_full': device_info.get('TimeToFull', 0)
-                    }
+            battery_device = self._battery_path or self._resolve_battery_path()
+            if battery_device:
+                device_info = self.upower.get_full_device_information(battery_device)
+                return {
+                    'percentage': int(device_info.get('Percentage', 0)),
+                    'is_charging': device_info.get('State') == 1,
+                    'is_on_battery': self.upower.on_battery(),
+                    'time_to_empty': device_info.get('TimeToEmpty', 0),
+                    'time_to_full': device_info.get('TimeToFull', 0)
+                }
         except Exception as e:
             logger.error(f"Failed to get battery info: {e}")
         return None
 
-    def _handle_auto_suspend(self, battery_level):
+    def _handle_auto_suspend(self, battery_level, power_config):
         """Handle automatic system suspend on critical battery."""
-        config = load_config()
-        power_config = config.get("power_controls", {})
-        
         enable_auto_suspend = power_config.get("enable_auto_suspend", False)
         suspend_trigger_level = power_config.get("suspend_trigger_level", 5)
         suspend_delay_minutes = power_config.get("suspend_delay_minutes", 5)
@@ -288,10 +392,13 @@ class PowerManagerService(Service):
             logger.error(f"Failed to execute suspend: {e}")
         return False  # Don't repeat timer
 
-    def _handle_performance_mode(self, battery_level, is_on_battery):
+    def _handle_performance_mode(self, battery_level, is_on_battery, power_config):
         """Handle automatic performance mode switching."""
-        config = load_config()
-        power_config = config.get("power_controls", {})
+        # The decision below only depends on these
+        inputs = (battery_level, is_on_battery, power_config)
+        if inputs == self._last_perf_inputs:
+            return
+        self._last_perf_inputs = inputs
         
         enable_performance_mode = power_config.get("enable_performance_mode", True)
         performance_battery_level = power_config.get("performance_mode_battery_level", 50)
@@ -309,29 +416,44 @@ class PowerManagerService(Service):
             self._set_performance_mode("performance")
             self.performance_mode_set = False
 
+    @staticmethod
+    def _probe_governors():
+        """Pick the governor for each mode from the ones the kernel offers."""
+        try:
+            with open(CPUFREQ_AVAILABLE_GOVERNORS) as f:
+                available = set(f.read().split())
+        except OSError as e:
+            logger.debug(f"CPU frequency scaling unavailable: {e}")
+            return {}
+        
+        return {
+            mode: next((g for g in governors if g in available), None)
+            for mode, governors in PREFERRED_GOVERNORS.items()
+        }
+
     def _set_performance_mode(self, mode):
         """Set CPU performance mode."""
+        governor = self._governor_for.get(mode)
+        if governor is None:
+            logger.debug(f"No available CPU governor for {mode} mode")
+            return
+        
         try:
             from fabric.utils.helpers import exec_shell_command_async
             
-            # Try different governors based on availability
-            governors = {
-                "powersave": ["powersave", "conservative"],
-                "performance": ["performance", "ondemand", "schedutil"]
-            }
-            
-            target_governors = governors.get(mode, ["ondemand"])
-            
-            # Try to set governor for all CPUs
-            for governor in target_governors:
-                command = f"echo {governor} | sudo tee /sys/devices/system/cpu/cpu*/cpufreq/scaling_governor"
-                exec_shell_command_async(
-                    command,
-                    lambda exit_code, stdout, stderr: 
-                        logger.info(f"Set CPU governor to {governor}") if exit_code == 0 
-                        else logger.debug(f"Failed to set governor {governor}: {stderr}")
-                )
-                break  # Use first available governor
+            # Set the governor for all CPUs in one privileged call, preferring
+            # cpupower and falling back to writing every sysfs file directly
+            script = (
+                f"if sudo -n cpupower frequency-set -g {governor} >/dev/null 2>&1 || "
+                f"sudo -n sh -c 'for f in {CPUFREQ_GOVERNOR_GLOB}; do echo {governor} > \"$f\"; done' 2>/dev/null; "
+                "then echo ok; else echo failed; fi"
+            )
+            exec_shell_command_async(
+                f"sh -c {shlex.quote(script)}",
+                lambda output, governor=governor:
+                    logger.info(f"Set CPU governor to {governor}") if output.strip() == "ok"
+                    else logger.debug(f"Failed to set governor {governor}")
+            )
             
         except Exception as e:
             logger.error(f"Failed to set performance mode: {e}")
@@ -342,6 +464,14 @@ class PowerManagerService(Service):
             GLib.source_remove(self.battery_timer)
             self.battery_timer = None
         
+        for subscription in self._signal_subscriptions:
+            self._system_bus.signal_unsubscribe(subscription)
+        self._signal_subscriptions.clear()
+        
+        if self._config_monitor:
+            self._config_monitor.cancel()
+            self._config_monitor = None
+        
         if self.suspend_timer:
             GLib.source_remove(self.suspend_timer)
             self.suspend_timer = None
@@ -1,61 +1,289 @@
+import functools
+import os
 import subprocess
 import json
+import time
+
+import numpy as np
+from loguru import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from fabric.hyprland.widgets import get_hyprland_connection
 
 import config.data as data
 
+HYPRLAND_SOCKET = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR", "/tmp"),
+    "hypr",
+    os.environ.get("HYPRLAND_INSTANCE_SIGNATURE", ""),
+    ".socket.sock",
+)
+
+# Workspaces, monitors and windows rarely change between back-to-back checks,
+# so they are reused until Hyprland reports a change. Events don't cover
+# everything (resizing or swapping tiled windows and dragging floating ones send
+# none), so entries still expire: quickly when polling hyprctl, and while events
+# are being watched, within the 500 ms the notch and dock poll at
+CACHE_TTL = 0.2
+EVENT_CACHE_TTL = 0.5
+_CACHE_EVENTS = (
+    "workspace",
+    "focusedmon",
+    "monitoradded",
+    "monitorremoved",
+    "openwindow",
+    "closewindow",
+    "movewindow",
+    "movewindowv2",
+    "changefloatingmode",
+    "fullscreen",
+    "activewindow",
+)
+_cache = {}
+_watching_events = False
+
+# Failures repeat on every poll while Hyprland misbehaves, so each call site
+# logs at most once per LOG_INTERVAL seconds
+LOG_INTERVAL = 1.0
+_last_log_ts = {}
+
+def _warn(site, message):
+    """
+    Log a warning, unless the same site logged one within LOG_INTERVAL.
+    """
+    now = time.monotonic()
+    if now - _last_log_ts.get(site, float("-inf")) < LOG_INTERVAL:
+        return
+    _last_log_ts[site] = now
+    logger.warning(message)
+
+def _json_loads(raw):
+    """
+    Parse a JSON reply, using orjson when it is available.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _hypr_query(command):
+    """
+    Run a JSON query such as "clients" against Hyprland.
+
+    Uses the shared IPC socket connection, and only spawns hyprctl when the
+    socket isn't there.
+    """
+    if os.path.exists(HYPRLAND_SOCKET):
+        return _json_loads(get_hyprland_connection().send_command(f"j/{command}").reply)
+
+    # Both parsers take the raw bytes, so stdout is never decoded to str
+    result = subprocess.run(
+        ["hyprctl", "-j", command],
+        capture_output=True
+    )
+    return _json_loads(result.stdout)
+
+def _hypr_batch(commands):
+    """
+    Run several JSON queries in a single Hyprland request.
+
+    Returns the parsed results in the same order as commands.
+    """
+    request = ";".join(f"j/{command}" for command in commands)
+    if os.path.exists(HYPRLAND_SOCKET):
+        reply = get_hyprland_connection().send_command(f"[[BATCH]]{request}").reply
+    else:
+        reply = subprocess.run(
+            ["hyprctl", "--batch", request],
+            capture_output=True
+        ).stdout
+
+    # Hyprland separates the replies in a batch with blank lines
+    chunks = [chunk for chunk in reply.split(b"\n\n\n") if chunk.strip()]
+    if len(chunks) != len(commands):
+        # Unexpected framing, ask for each result separately instead
+        return [_hypr_query(command) for command in commands]
+    return [_json_loads(chunk) for chunk in chunks]
+
+def _watch_hyprland_events():
+    """
+    Clear the cache on Hyprland events that change workspaces, monitors or windows.
+    """
+    global _watching_events
+    if _watching_events or not os.path.exists(HYPRLAND_SOCKET):
+        return
+    _watching_events = True
+    conn = get_hyprland_connection()
+    for event in _CACHE_EVENTS:
+        conn.connect(f"event::{event}", lambda *args: _cache.clear())
+
+def _cache_get(key):
+    entry = _cache.get(key)
+    ttl = EVENT_CACHE_TTL if _watching_events else CACHE_TTL
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+def _cache_put(key, value):
+    _watch_hyprland_events()
+    _cache[key] = (time.monotonic(), value)
+    return value
+
+def _is_fullscreen(client):
+    """
+    Check if a client is truly fullscreen, rather than maximized.
+
+    Current Hyprland reports "fullscreen" as a mode (1 is maximized, 2 is
+    fullscreen), older releases as a bool next to "fullscreenMode" (0 is
+    fullscreen, 1 is maximized). Maximized windows are left to the geometry test.
+    """
+    fullscreen = client.get("fullscreen")
+    if isinstance(fullscreen, bool):
+        return fullscreen and client.get("fullscreenMode", 0) == 0
+    return isinstance(fullscreen, int) and fullscreen >= 2
+
+def _workspace_windows(clients, workspace):
+    """
+    Collect the mapped windows on a workspace.
+
+    Returns:
+        tuple: (rects, fullscreen_monitors) where rects is an int32 array of
+            shape (4, N) whose rows are the windows' x1, y1, x2 and y2, and
+            fullscreen_monitors is the set of monitor IDs with a fullscreen window
+    """
+    rects = []
+    fullscreen_monitors = set()
+    for client in clients:
+        if not client.get("mapped", False):
+            continue
+        if client.get("workspace", {}).get("id") != workspace:
+            continue
+
+        if _is_fullscreen(client):
+            fullscreen_monitors.add(client.get("monitor"))
+
+        # Ensure client has position and size info
+        position = client.get("at")
+        size = client.get("size")
+        if not position or not size:
+            continue
+
+        x, y = position
+        rects.append((x, y, x + size[0], y + size[1]))
+    # One contiguous row per coordinate, so the comparisons below each scan
+    # sequential memory instead of striding across windows
+    rects = np.ascontiguousarray(np.array(rects, dtype=np.int32).reshape(-1, 4).T)
+    return rects, frozenset(fullscreen_monitors)
+
+def _overlap_mask(rects, x1, y1, x2, y2):
+    """
+    Get a boolean mask of the rects that overlap the rectangle (x1, y1, x2, y2).
+    """
+    rx1, ry1, rx2, ry2 = rects
+    return ~((rx2 <= x1) | (rx1 >= x2) | (ry2 <= y1) | (ry1 >= y2))
+
+def _any_overlap(rects, x1, y1, x2, y2):
+    """
+    Check if any of the rects overlaps the rectangle (x1, y1, x2, y2).
+    """
+    return bool(_overlap_mask(rects, x1, y1, x2, y2).any())
+
+def _get_layout():
+    """
+    Get the (active workspace, monitors) pair, cached until it changes.
+    """
+    layout = _cache_get("layout")
+    if layout is None:
+        layout = _cache_put("layout", tuple(_hypr_batch(["activeworkspace", "monitors"])))
+    return layout
+
 def get_current_workspace():
     """
-    Get the current workspace ID using hyprctl.
+    Get the current workspace ID from Hyprland.
     """
     try:
-        result = subprocess.run(
-            ["hyprctl", "activeworkspace"],
-            capture_output=True,
-            text=True
-        )
-        # Assume the output similar to: "ID <number>"
-        # Extracting the number from the output
-        parts = result.stdout.split()
-        for i, part in enumerate(parts):
-            if part == "ID" and i + 1 < len(parts):
-                return int(parts[i+1])
+        active_workspace, _ = _get_layout()
+        return active_workspace.get("id", -1)
     except Exception as e:
-        print(f"Error getting current workspace: {e}")
+        _warn("workspace", f"Error getting current workspace: {e}")
     return -1
 
 def get_screen_dimensions():
     """
-    Get screen dimensions from hyprctl.
+    Get screen dimensions from Hyprland.
     
     Returns:
         tuple: (width, height) of the monitor containing the current workspace
     """
     try:
-        # Get current workspace
-        workspace_id = get_current_workspace()
-        
-        # Get monitor information
-        result = subprocess.run(
-            ["hyprctl", "-j", "monitors"],
-            capture_output=True,
-            text=True
-        )
-        monitors = json.loads(result.stdout)
-        
-        # Find the monitor containing our workspace
-        for monitor in monitors:
-            if monitor.get("activeWorkspace", {}).get("id") == workspace_id:
-                return monitor.get("width", data.CURRENT_WIDTH), monitor.get("height", data.CURRENT_HEIGHT)
-                
-        # Fallback to first monitor
-        if monitors:
-            return monitors[0].get("width", data.CURRENT_WIDTH), monitors[0].get("height", data.CURRENT_HEIGHT)
+        active_workspace, monitors = _get_layout()
+        return _monitor_size(monitors, active_workspace.get("id", -1))
     except Exception as e:
-        print(f"Error getting screen dimensions: {e}")
+        _warn("screen", f"Error getting screen dimensions: {e}")
     
     # Default fallback values
     return data.CURRENT_WIDTH, data.CURRENT_HEIGHT
 
+def _monitor_size(monitors, workspace_id):
+    """
+    Get the (width, height) of the monitor showing workspace_id.
+    """
+    # Find the monitor containing our workspace
+    for monitor in monitors:
+        if monitor.get("activeWorkspace", {}).get("id") == workspace_id:
+            return monitor.get("width", data.CURRENT_WIDTH), monitor.get("height", data.CURRENT_HEIGHT)
+            
+    # Fallback to first monitor
+    if monitors:
+        return monitors[0].get("width", data.CURRENT_WIDTH), monitors[0].get("height", data.CURRENT_HEIGHT)
+
+    # Default fallback values
+    return data.CURRENT_WIDTH, data.CURRENT_HEIGHT
+
+def _resolve_monitor(monitors, monitor_id, workspace_id):
+    """
+    Get the (x, y, width, height) of the monitor to check.
+
+    Uses the monitor with monitor_id when it is given and found, otherwise the
+    size of the monitor showing workspace_id placed at the origin (legacy
+    behavior).
+    """
+    if monitor_id is not None:
+        for monitor in monitors:
+            if monitor.get("id") == monitor_id:
+                return (
+                    monitor.get("x", 0),
+                    monitor.get("y", 0),
+                    monitor.get("width", data.CURRENT_WIDTH),
+                    monitor.get("height", data.CURRENT_HEIGHT),
+                )
+
+    return (0, 0, *_monitor_size(monitors, workspace_id))
+
+# (side, size) -> (x, y, width, height), given the monitor's x, y, width and height
+_SIDE_TABLE = {
+    "top": lambda mx, my, sw, sh, size: (mx, my, sw, size),
+    "bottom": lambda mx, my, sw, sh, size: (mx, my + sh - size, sw, size),
+    "left": lambda mx, my, sw, sh, size: (mx, my, size, sh),
+    "right": lambda mx, my, sw, sh, size: (mx + sw - size, my, size, sh),
+}
+
+@functools.lru_cache(maxsize=64)
+def _side_rect(side, size, monitor_x, monitor_y, screen_width, screen_height):
+    """
+    Convert a (side, size) region into (x, y, width, height) on a monitor.
+
+    The monitor geometry is part of the cache key, so entries never go stale.
+    Returns None for an unknown side.
+    """
+    to_rect = _SIDE_TABLE.get(side.lower())
+    if to_rect is None:
+        return None
+    return to_rect(monitor_x, monitor_y, screen_width, screen_height, size)
+
 def check_occlusion(occlusion_region, workspace=None, monitor_id=None):
     """
     Check if a region is occupied by any window on a given workspace and monitor.
@@ -71,129 +299,90 @@ def check_occlusion(occlusion_region, workspace=None, monitor_id=None):
     Returns:
         bool: True if any window overlaps with the occlusion region, False otherwise.
     """
-    if workspace is None:
-        workspace = get_current_workspace()
+    # The answer only changes along with the layout and windows, so it is
+    # reused until an event or the TTL clears the cache like their entries
+    if not isinstance(occlusion_region, tuple):
+        _warn("region", f"Invalid occlusion region format: {occlusion_region}")
+        return False
+    key = ("result", occlusion_region, workspace, monitor_id)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    result = _evaluate_occlusion(occlusion_region, workspace, monitor_id)
+    if result is None:
+        return False
+    return _cache_put(key, result)
+
+def _evaluate_occlusion(occlusion_region, workspace, monitor_id):
+    """
+    Compute check_occlusion's answer, or None when it couldn't be determined.
+    """
+    # Everything needed below comes from a single batched request, or less
+    # when parts of it are still cached
+    clients = None
+    try:
+        layout = _cache_get("layout")
+        if layout is None:
+            active_workspace, monitors, clients = _hypr_batch(["activeworkspace", "monitors", "clients"])
+            _cache_put("layout", (active_workspace, monitors))
+        else:
+            active_workspace, monitors = layout
+
+        active_workspace_id = active_workspace.get("id", -1)
+        if workspace is None:
+            workspace = active_workspace_id
+
+        # Only mapped windows on the workspace can occlude anything, so the
+        # rest are dropped right after parsing
+        windows = _cache_get(("clients", workspace))
+        if windows is None:
+            if clients is None:
+                clients = _hypr_query("clients")
+            windows = _cache_put(("clients", workspace), _workspace_windows(clients, workspace))
+        rects, fullscreen_monitors = windows
+    except Exception as e:
+        _warn("query", f"Error querying Hyprland: {e}")
+        return None
     
-    # Get monitor information for the specific monitor if provided
-    monitor_info = None
-    if monitor_id is not None:
-        try:
-            result = subprocess.run(
-                ["hyprctl", "-j", "monitors"],
-                capture_output=True,
-                text=True
-            )
-            monitors = json.loads(result.stdout)
-            monitor_info = next((m for m in monitors if m.get("id") == monitor_id), None)
-        except Exception as e:
-            print(f"Error getting monitor info: {e}")
+    monitor_x, monitor_y, screen_width, screen_height = _resolve_monitor(
+        monitors, monitor_id, active_workspace_id
+    )
     
     # Handle simplified side-based format
     if isinstance(occlusion_region, tuple) and len(occlusion_region) == 2:
         side, size = occlusion_region
         if isinstance(side, str):
             # Convert side-based format to coordinates
-            if monitor_info:
-                # Use specific monitor dimensions and position
-                screen_width = monitor_info.get("width", data.CURRENT_WIDTH)
-                screen_height = monitor_info.get("height", data.CURRENT_HEIGHT)
-                monitor_x = monitor_info.get("x", 0)
-                monitor_y = monitor_info.get("y", 0)
-            else:
-                # Use global screen dimensions (legacy behavior)
-                screen_width, screen_height = get_screen_dimensions()
-                monitor_x, monitor_y = 0, 0
-            
-            if side.lower() == "bottom":
-                occlusion_region = (monitor_x, monitor_y + screen_height - size, screen_width, size)
-            elif side.lower() == "top":
-                occlusion_region = (monitor_x, monitor_y, screen_width, size)
-            elif side.lower() == "left":
-                occlusion_region = (monitor_x, monitor_y, size, screen_height)
-            elif side.lower() == "right":
-                occlusion_region = (monitor_x + screen_width - size, monitor_y, size, screen_height)
+            occlusion_region = _side_rect(
+                side, size, monitor_x, monitor_y, screen_width, screen_height
+            ) or occlusion_region
     
     # Ensure occlusion_region is in the correct format (x, y, width, height)
     if not isinstance(occlusion_region, tuple) or len(occlusion_region) != 4:
-        print(f"Invalid occlusion region format: {occlusion_region}")
-        return False
-
-    try:
-        result = subprocess.run(
-            ["hyprctl", "-j", "clients"],
-            capture_output=True,
-            text=True
-        )
-        clients = json.loads(result.stdout)
-    except Exception as e:
-        print(f"Error retrieving client windows: {e}")
-        return False
+        _warn("region", f"Invalid occlusion region format: {occlusion_region}")
+        return None
 
     occ_x, occ_y, occ_width, occ_height = occlusion_region
     occ_x2 = occ_x + occ_width
     occ_y2 = occ_y + occ_height
 
-    # Get screen dimensions for fullscreen check
-    if monitor_info:
-        screen_width = monitor_info.get("width", data.CURRENT_WIDTH)
-        screen_height = monitor_info.get("height", data.CURRENT_HEIGHT)
-        monitor_x = monitor_info.get("x", 0)
-        monitor_y = monitor_info.get("y", 0)
-    else:
-        screen_width, screen_height = get_screen_dimensions()
-        monitor_x, monitor_y = 0, 0
-
-    for client in clients:
-        # Check if client is mapped
-        if not client.get("mapped", False):
-            continue
-
-        # Ensure client has proper workspace information and matches the workspace
-        client_workspace = client.get("workspace", {})
-        if client_workspace.get("id") != workspace:
-            continue
-
-        # Ensure client has position and size info
-        position = client.get("at")
-        size = client.get("size")
-        if not position or not size:
-            continue
+    monitor_x2, monitor_y2 = monitor_x + screen_width, monitor_y + screen_height
 
-        x, y = position
-        width, height = size
-        win_x1, win_y1 = x, y
-        win_x2, win_y2 = x + width, y + height
-
-        # If monitor_id is specified, only check windows on that monitor
-        if monitor_id is not None:
-            # Check if window is on the specified monitor
-            window_monitor_x1, window_monitor_y1 = win_x1, win_y1
-            window_monitor_x2, window_monitor_y2 = win_x2, win_y2
-            monitor_x1, monitor_y1 = monitor_x, monitor_y
-            monitor_x2, monitor_y2 = monitor_x + screen_width, monitor_y + screen_height
-            
-            # Check if window overlaps with the specified monitor
-            if (window_monitor_x2 <= monitor_x1 or window_monitor_x1 >= monitor_x2 or 
-                window_monitor_y2 <= monitor_y1 or window_monitor_y1 >= monitor_y2):
-                continue  # Window is not on this monitor, skip it
-
-        # Check for fullscreen windows relative to the monitor
-        if monitor_info:
-            # Check if window covers the entire monitor
-            if (width >= screen_width and height >= screen_height and 
-                abs(x - monitor_x) <= 1 and abs(y - monitor_y) <= 1):
-                # For fullscreen windows, check if occlusion region is the top area
-                if occ_y == monitor_y and occ_height > 0:  # Top region of this monitor
-                    return True  # Consider fullscreen as occluding the top
-        else:
-            # Legacy behavior for backward compatibility
-            if (width, height) == (screen_width, screen_height) and (x, y) == (0, 0):
-                # For fullscreen windows, check if occlusion region is the top area
-                if occ_y == 0 and occ_height > 0:  # Top region
-                    return True  # Consider fullscreen as occluding the top
+    # Fullscreen windows are considered to occlude the top region of their
+    # monitor, found from Hyprland's fullscreen flag instead of geometry. Without
+    # a monitor_id the region's monitor is unknown, so the overlap test decides
+    if monitor_id is not None and monitor_id in fullscreen_monitors and occ_y == monitor_y and occ_height > 0:
+        return True
 
-        # Check for intersection between the window and occlusion region
-        if not (win_x2 <= occ_x or win_x1 >= occ_x2 or win_y2 <= occ_y or win_y1 >= occ_y2):
-            return True  # Occlusion region is occupied
+    # A window that overlaps a region inside the monitor is necessarily on that
+    # monitor, so the monitor test is only needed for regions reaching past it
+    if monitor_id is None or (
+        monitor_x <= occ_x and occ_x2 <= monitor_x2 and monitor_y <= occ_y and occ_y2 <= monitor_y2
+    ):
+        return _any_overlap(rects, occ_x, occ_y, occ_x2, occ_y2)
 
-    return False  # No window overlaps the occlusion region
+    return bool((
+        _overlap_mask(rects, occ_x, occ_y, occ_x2, occ_y2) &
+        _overlap_mask(rects, monitor_x, monitor_y, monitor_x2, monitor_y2)
+    ).any())